@@ -1,17 +1,34 @@
 from plain import http
 
 
-class JsonResponseList(http.JsonResponse):
+class EncodedJsonMixin:
+    """
+    Allow a JSON response to be built from already-encoded bytes
+    (passed as ``content``) instead of serializing ``data`` again.
+    """
+
+    def __init__(self, data=None, *args, content=None, **kwargs):
+        if content is None:
+            super().__init__(data, *args, **kwargs)
+        else:
+            kwargs.setdefault("content_type", "application/json")
+            http.Response.__init__(self, content, *args, **kwargs)
+
+
+class JsonResponseList(EncodedJsonMixin, http.JsonResponse):
     openapi_description = "List of objects"
 
-    def __init__(self, data, *args, **kwargs):
+    def __init__(self, data=None, *args, content=None, **kwargs):
+        if content is not None:
+            super().__init__(None, *args, content=content, **kwargs)
+            return
         if not isinstance(data, list):
             raise TypeError("data must be a list")
         kwargs["safe"] = False  # Allow a list to be dumped instead of a dict
         super().__init__(data, *args, **kwargs)
 
 
-class JsonResponseCreated(http.JsonResponse):
+class JsonResponseCreated(EncodedJsonMixin, http.JsonResponse):
     status_code = 201
     openapi_description = "Created"
 
@@ -38,5 +55,5 @@ class ResponseNotFound(http.ResponseNotFound):
     openapi_description = "Not found"
 
 
-class JsonResponse(http.JsonResponse):
+class JsonResponse(EncodedJsonMixin, http.JsonResponse):
     openapi_description = "OK"
@@ -1,9 +1,13 @@
 import datetime
 import json
+import math
 from typing import TYPE_CHECKING, Any
 
 from plain.auth.views import AuthViewMixin
 from plain.exceptions import ObjectDoesNotExist
+from plain.json import PlainJSONEncoder
+from plain.models import QuerySet
+from plain.utils.datastructures import MultiValueDict
 from plain.views.base import View
 from plain.views.csrf import CsrfExemptViewMixin
 from plain.views.exceptions import ResponseException
@@ -23,6 +27,21 @@ if TYPE_CHECKING:
 
 from .models import APIKey
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _replace_non_finite_floats(data):
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _replace_non_finite_floats(value) for key, value in data.items()}
+    if isinstance(data, list | tuple):
+        return [_replace_non_finite_floats(value) for value in data]
+    return data
+
 
 class APIAuthViewMixin(AuthViewMixin):
     # Disable login redirects
@@ -97,20 +116,55 @@ class APIBaseView(View):
         else:
             return self.form_invalid(form)
 
+    def _encode_json(self, data) -> bytes:
+        """
+        Encode response data with sorted keys, using orjson when it is installed.
+
+        Dates, times, decimals and lazy strings are still formatted by
+        PlainJSONEncoder, and the json fallback writes compact UTF-8 with
+        NaN and Infinity as null, the way orjson does.
+        """
+        if orjson:
+            return orjson.dumps(
+                data,
+                default=PlainJSONEncoder().default,
+                option=orjson.OPT_SORT_KEYS
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+
+        return json.dumps(
+            _replace_non_finite_floats(data),
+            cls=PlainJSONEncoder,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode()
+
     def get_form_kwargs(self) -> dict[str, Any]:
-        if not self.request.body:
+        body = self.request.body
+        if not body:
             raise ResponseException(ResponseBadRequest("No JSON body provided"))
 
         try:
-            data = json.loads(self.request.body)
-        except json.JSONDecodeError:
+            if orjson:
+                data = orjson.loads(body)
+            else:
+                data = json.loads(body)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError is a subclass
             raise ResponseException(
                 JsonResponseBadRequest({"error": "Unable to parse JSON"})
             )
 
+        if self.request.content_type == "multipart/form-data":
+            files = self.request.FILES
+        else:
+            # Skip the upload parsing for regular JSON requests
+            files = MultiValueDict()
+
         return {
             "data": data,
-            "files": self.request.FILES,
+            "files": files,
         }
 
     def form_valid(self, form: "BaseForm") -> JsonResponse | JsonResponseCreated:
@@ -122,19 +176,9 @@ class APIBaseView(View):
         data = self.object_to_dict(object)
 
         if self.request.method == "POST":
-            return JsonResponseCreated(
-                data,
-                json_dumps_params={
-                    "sort_keys": True,
-                },
-            )
+            return JsonResponseCreated(content=self._encode_json(data))
         else:
-            return JsonResponse(
-                data,
-                json_dumps_params={
-                    "sort_keys": True,
-                },
-            )
+            return JsonResponse(content=self._encode_json(data))
 
     def form_invalid(self, form: "BaseForm") -> JsonResponseBadRequest:
         return JsonResponseBadRequest(
@@ -150,7 +194,13 @@ class APIObjectListView(CsrfExemptViewMixin, APIBaseView):
             # Custom 404 with no body
             raise ResponseException(ResponseNotFound())
 
-        if not self.objects:
+        if hasattr(self.objects, "exists"):
+            # Check a queryset without loading all of its rows
+            has_objects = self.objects.exists()
+        else:
+            has_objects = bool(self.objects)
+
+        if not has_objects:
             # Also raise 404 if the object is None
             raise ResponseException(ResponseNotFound())
 
@@ -159,11 +209,18 @@ class APIObjectListView(CsrfExemptViewMixin, APIBaseView):
             f"get_objects() is not implemented on {self.__class__.__name__}"
         )
 
+    def _serialize_objects(self, objects) -> JsonResponseList:
+        if isinstance(objects, QuerySet):
+            # Don't cache model instances on the queryset while converting them
+            objects = objects.iterator(chunk_size=2000)
+
+        data = [self.object_to_dict(obj) for obj in objects]
+        return JsonResponseList(content=self._encode_json(data))
+
     def get(self) -> JsonResponseList | ResponseNotFound | ResponseBadRequest:
         self.load_objects()
         # TODO paginate??
-        data = [self.object_to_dict(obj) for obj in self.objects]
-        return JsonResponseList(data)
+        return self._serialize_objects(self.objects)
 
     def post(
         self,
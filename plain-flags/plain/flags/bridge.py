@@ -15,14 +15,12 @@ def get_flags_module():
         ) from e
 
 
-def get_flag_class(flag_name: str) -> Flag:
+def get_defined_flag_names() -> set[str]:
+    """Names of all Flag subclasses defined in the flags module."""
     flags_module = get_flags_module()
 
-    try:
-        flag_class = getattr(flags_module, flag_name)
-    except AttributeError as e:
-        raise exceptions.FlagImportError(
-            f"Could not find {flag_name} in {flags_module} module"
-        ) from e
-
-    return flag_class
+    return {
+        name
+        for name, value in vars(flags_module).items()
+        if isinstance(value, type) and issubclass(value, Flag) and value is not Flag
+    }
@@ -7,12 +7,15 @@ from plain.models import ProgrammingError
 from plain.preflight import Info
 from plain.runtime import settings
 
-from .bridge import get_flag_class
+from .bridge import get_defined_flag_names
 from .exceptions import FlagImportError
 
 
+_FLAG_NAME_RE = re.compile(r"[a-zA-Z_][a-zA-Z0-9_]*\Z")
+
+
 def validate_flag_name(value):
-    if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", value):
+    if not _FLAG_NAME_RE.match(value):
         raise ValidationError(f"{value} is not a valid Python identifier name")
 
 
@@ -72,29 +75,29 @@ class Flag(models.Model):
         if not databases:
             return errors
 
+        try:
+            defined_flag_names = get_defined_flag_names()
+        except FlagImportError:
+            defined_flag_names = set()
+
         for database in databases:
-            flag_names = (
-                cls.objects.using(database).all().values_list("name", flat=True)
-            )
+            flag_names = cls.objects.using(database).values_list("name", flat=True)
 
             try:
-                flag_names = set(flag_names)
+                flag_names = set(flag_names.iterator(chunk_size=2000))
             except ProgrammingError:
                 # The table doesn't exist yet
                 # (migrations probably haven't run yet),
                 # so we can't check it.
                 continue
 
-            for flag_name in flag_names:
-                try:
-                    get_flag_class(flag_name)
-                except FlagImportError:
-                    errors.append(
-                        Info(
-                            f"Flag {flag_name} is not used.",
-                            hint=f"Remove the flag from the database or define it in the {settings.FLAGS_MODULE} module.",
-                            id="plain.flags.I001",
-                        )
+            for flag_name in flag_names - defined_flag_names:
+                errors.append(
+                    Info(
+                        f"Flag {flag_name} is not used.",
+                        hint=f"Remove the flag from the database or define it in the {settings.FLAGS_MODULE} module.",
+                        id="plain.flags.I001",
                     )
+                )
 
         return errors
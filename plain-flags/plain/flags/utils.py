@@ -2,6 +2,9 @@ from typing import Any
 
 from plain import models
 
+# "package_label.model_name" for each model class that has been used as a key
+_model_key_prefixes: dict[type, str] = {}
+
 
 def coerce_key(key: Any) -> str:
     """
@@ -12,6 +15,13 @@ def coerce_key(key: Any) -> str:
         return key
 
     if isinstance(key, models.Model):
-        return f"{key._meta.package_label}.{key._meta.model_name}:{key.pk}"
+        model_class = type(key)
+        try:
+            prefix = _model_key_prefixes[model_class]
+        except KeyError:
+            prefix = f"{key._meta.package_label}.{key._meta.model_name}"
+            _model_key_prefixes[model_class] = prefix
+
+        return f"{prefix}:{key.pk}"
 
     return str(key)
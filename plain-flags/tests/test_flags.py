@@ -1,4 +1,7 @@
+import pytest
+from plain.exceptions import ValidationError
 from plain.flags import Flag
+from plain.flags.models import validate_flag_name
 
 
 def test_flag(db):
@@ -11,3 +14,11 @@ def test_flag(db):
 
     flag = TestFlag()
     assert flag.value is True
+
+
+def test_validate_flag_name():
+    validate_flag_name("TestFlag_1")
+
+    for name in ["1Flag", "Test-Flag", "TestFlag\n", ""]:
+        with pytest.raises(ValidationError):
+            validate_flag_name(name)
@@ -9,10 +9,17 @@ class RedirectionMiddleware:
         response = self.get_response(request)
 
         if response.status_code == 404:
+            from plain.models import Q
+
             from .models import NotFoundLog, Redirect, RedirectLog
 
-            redirects = Redirect.objects.filter(enabled=True).only(
-                "id", "from_pattern", "to_pattern", "http_status", "is_regex"
+            # Exact patterns can be found through the unique from_pattern index,
+            # so only regex redirects need to be loaded and tested one by one
+            exact_urls = [request.path, request.build_absolute_uri()]
+            redirects = (
+                Redirect.objects.filter(enabled=True)
+                .filter(Q(is_regex=True) | Q(from_pattern__in=exact_urls))
+                .only("id", "from_pattern", "to_pattern", "http_status", "is_regex")
             )
             for redirect in redirects:
                 if redirect.matches_request(request):
@@ -0,0 +1,26 @@
+# Generated by Plain 0.28.0 on 2026-10-15 01:40
+
+from plain import models
+from plain.models import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        (
+            "plainredirection",
+            "0008_alter_notfoundlog_url_alter_redirectlog_from_url_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="redirectlog",
+            index=models.Index(
+                fields=["redirect", "-created_at"], name="redirectlog_redirect_created"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notfoundlog",
+            index=models.Index(fields=["-created_at"], name="notfoundlog_created_at"),
+        ),
+    ]
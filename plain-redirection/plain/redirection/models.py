@@ -82,6 +82,12 @@ class RedirectLog(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Used to list the most recent logs for a redirect
+            models.Index(
+                name="redirectlog_redirect_created", fields=["redirect", "-created_at"]
+            ),
+        ]
 
     @classmethod
     def from_redirect(cls, redirect, request):
@@ -118,6 +124,9 @@ class NotFoundLog(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(name="notfoundlog_created_at", fields=["-created_at"]),
+        ]
 
     @classmethod
     def from_request(cls, request):
@@ -4,8 +4,6 @@ import click
 
 from plain.runtime import APP_PATH
 
-from .core import Tailwind
-
 
 @click.group("tailwind")
 def cli():
@@ -17,6 +15,8 @@ def cli():
 @click.pass_context
 def init(ctx):
     """Install Tailwind, create a tailwind.config.js and app/assets/src/tailwind.css"""
+    from .core import Tailwind
+
     tailwind = Tailwind()
 
     if not tailwind.is_installed():
@@ -32,6 +32,8 @@ def init(ctx):
 @cli.command()
 @click.pass_context
 def install(ctx):
+    from .core import Tailwind
+
     tailwind = Tailwind()
 
     if not tailwind.is_installed() or tailwind.needs_update():
@@ -53,6 +55,8 @@ def install(ctx):
 @cli.command()
 def update():
     """Update the Tailwind CSS version"""
+    from .core import Tailwind
+
     tailwind = Tailwind()
     click.secho("Installing Tailwind standalone...", bold=True, nl=True)
     version = tailwind.install()
@@ -65,6 +69,8 @@ def update():
 @click.pass_context
 def build(ctx, watch, minify):
     """Compile a Tailwind CSS file"""
+    from .core import Tailwind
+
     tailwind = Tailwind()
 
     ctx.invoke(install)
@@ -72,11 +78,14 @@ def build(ctx, watch, minify):
     # https://github.com/tailwindlabs/tailwindcss/issues/15452
     # Remove the .gitignore inside of .venv if it exists, so the sources
     # are picked up correctly...
-    if os.path.exists(".venv/.gitignore"):
+    try:
+        os.remove(".venv/.gitignore")
+    except FileNotFoundError:
+        pass
+    else:
         click.secho(
-            "Removing .venv/.gitignore to fix tailwind bug...", bold=True, fg="yellow"
+            "Removed .venv/.gitignore to fix tailwind bug", bold=True, fg="yellow"
         )
-        os.remove(".venv/.gitignore")
 
     tailwind.update_plain_sources()
 
@@ -4,10 +4,11 @@ import signal
 
 import click
 
+from plain.models import Count, Q
 from plain.runtime import settings
 from plain.utils import timezone
 
-from .models import Job, JobRequest, JobResult
+from .models import Job, JobRequest, JobResult, JobResultStatuses
 from .registry import jobs_registry
 from .scheduling import load_schedule
 from .workers import Worker
@@ -50,6 +51,14 @@ def cli():
     type=int,
     envvar="PLAIN_JOBS_MAX_PENDING_PER_PROCESS",
 )
+@click.option(
+    "--local-queue-size",
+    "local_queue_size",
+    default=1,
+    type=int,
+    envvar="PLAIN_JOBS_LOCAL_QUEUE_SIZE",
+    help="Number of job requests to claim from the database at once",
+)
 @click.option(
     "--stats-every",
     "stats_every",
@@ -58,7 +67,12 @@ def cli():
     envvar="PLAIN_JOBS_STATS_EVERY",
 )
 def run(
-    queues, max_processes, max_jobs_per_process, max_pending_per_process, stats_every
+    queues,
+    max_processes,
+    max_jobs_per_process,
+    max_pending_per_process,
+    local_queue_size,
+    stats_every,
 ):
     jobs_schedule = load_schedule(settings.WORKER_JOBS_SCHEDULE)
 
@@ -68,6 +82,7 @@ def run(
         max_processes=max_processes,
         max_jobs_per_process=max_jobs_per_process,
         max_pending_per_process=max_pending_per_process,
+        local_queue_size=local_queue_size,
         stats_every=stats_every,
     )
 
@@ -84,14 +99,27 @@ def run(
 
 
 @cli.command()
-def clear_completed():
+@click.option(
+    "--batch-size",
+    "batch_size",
+    default=10_000,
+    type=click.IntRange(min=1),
+    help="Number of job results to delete per query",
+)
+def clear_completed(batch_size):
     """Clear all completed job results in all queues."""
     cutoff = timezone.now() - datetime.timedelta(
         seconds=settings.WORKER_JOBS_CLEARABLE_AFTER
     )
     click.echo(f"Clearing job results created before {cutoff}")
-    results = JobResult.objects.filter(created_at__lt=cutoff).delete()
-    click.echo(f"Deleted {results[0]} jobs")
+
+    # Delete in batches to keep each transaction (and its locks) small
+    clearable = JobResult.objects.filter(created_at__lt=cutoff)
+    deleted = 0
+    while batch_ids := list(clearable.values_list("pk", flat=True)[:batch_size]):
+        deleted += JobResult.objects.filter(pk__in=batch_ids).delete()[0]
+
+    click.echo(f"Deleted {deleted} jobs")
 
 
 @cli.command()
@@ -100,9 +128,15 @@ def stats():
     pending = JobRequest.objects.count()
     processing = Job.objects.count()
 
-    successful = JobResult.objects.successful().count()
-    errored = JobResult.objects.errored().count()
-    lost = JobResult.objects.lost().count()
+    # Count all of the result statuses in a single query
+    results = JobResult.objects.aggregate(
+        successful=Count("pk", filter=Q(status=JobResultStatuses.SUCCESSFUL)),
+        errored=Count("pk", filter=Q(status=JobResultStatuses.ERRORED)),
+        lost=Count("pk", filter=Q(status=JobResultStatuses.LOST)),
+    )
+    successful = results["successful"]
+    errored = results["errored"]
+    lost = results["lost"]
 
     click.secho(f"Pending: {pending}", bold=True)
     click.secho(f"Processing: {processing}", bold=True)
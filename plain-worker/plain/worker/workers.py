@@ -27,6 +27,7 @@ class Worker:
         max_processes=None,
         max_jobs_per_process=None,
         max_pending_per_process=10,
+        local_queue_size=1,
         stats_every=None,
     ):
         if jobs_schedule is None:
@@ -50,11 +51,14 @@ class Worker:
         self.max_jobs_per_process = max_jobs_per_process
         self.max_pending_per_process = max_pending_per_process
 
+        # How many JobRequests to claim from the database in a single query
+        self.local_queue_size = max(local_queue_size, 1)
+
         self._is_shutting_down = False
 
     def run(self):
         logger.info(
-            "⬣ Starting Plain worker\n    Registered jobs: %s\n    Queues: %s\n    Jobs schedule: %s\n    Stats every: %s seconds\n    Max processes: %s\n    Max jobs per process: %s\n    Max pending per process: %s\n    PID: %s",
+            "⬣ Starting Plain worker\n    Registered jobs: %s\n    Queues: %s\n    Jobs schedule: %s\n    Stats every: %s seconds\n    Max processes: %s\n    Max jobs per process: %s\n    Max pending per process: %s\n    Local queue size: %s\n    PID: %s",
             "\n                     ".join(
                 f"{name}: {cls}" for name, cls in jobs_registry.jobs.items()
             ),
@@ -64,6 +68,7 @@ class Worker:
             self.max_processes,
             self.max_jobs_per_process,
             self.max_pending_per_process,
+            self.local_queue_size,
             os.getpid(),
         )
 
@@ -77,9 +82,10 @@ class Worker:
                 # (these tasks are kind of ancilarry to the main job processing)
                 logger.exception(e)
 
-            if len(self.executor._pending_work_items) >= (
-                self.max_processes * self.max_pending_per_process
-            ):
+            available_pending = self.max_processes * self.max_pending_per_process - len(
+                self.executor._pending_work_items
+            )
+            if available_pending <= 0:
                 # We don't want to convert too many JobRequests to Jobs,
                 # because anything not started yet will be cancelled on deploy etc.
                 # It's easier to leave them in the JobRequest db queue as long as possible.
@@ -87,7 +93,9 @@ class Worker:
                 continue
 
             with transaction.atomic():
-                job_request = (
+                # Claim up to local_queue_size requests in one query
+                # (but never more than we're allowed to have pending)
+                job_requests = list(
                     JobRequest.objects.select_for_update(skip_locked=True)
                     .filter(
                         queue__in=self.queues,
@@ -96,34 +104,39 @@ class Worker:
                         models.Q(start_at__isnull=True)
                         | models.Q(start_at__lte=timezone.now())
                     )
-                    .order_by("priority", "-start_at", "-created_at")
-                    .first()
+                    .order_by("priority", "-start_at", "-created_at")[
+                        : min(self.local_queue_size, available_pending)
+                    ]
                 )
-                if not job_request:
+                if not job_requests:
                     # Potentially no jobs to process (who knows for how long)
                     # but sleep for a second to give the CPU and DB a break
                     time.sleep(1)
                     continue
 
-                logger.info(
-                    'Preparing to execute job job_class=%s job_request_uuid=%s job_priority=%s job_source="%s" job_queues="%s"',
-                    job_request.job_class,
-                    job_request.uuid,
-                    job_request.priority,
-                    job_request.source,
-                    job_request.queue,
-                )
+                job_uuids = []
 
-                job = job_request.convert_to_job()
+                for job_request in job_requests:
+                    logger.info(
+                        'Preparing to execute job job_class=%s job_request_uuid=%s job_priority=%s job_source="%s" job_queues="%s"',
+                        job_request.job_class,
+                        job_request.uuid,
+                        job_request.priority,
+                        job_request.source,
+                        job_request.queue,
+                    )
 
-            job_uuid = str(job.uuid)  # Make a str copy
+                    job = job_request.convert_to_job()
+                    job_uuids.append(str(job.uuid))  # Make a str copy
 
             # Release these now
+            del job_requests
             del job_request
             del job
 
-            future = self.executor.submit(process_job, job_uuid)
-            future.add_done_callback(partial(future_finished_callback, job_uuid))
+            for job_uuid in job_uuids:
+                future = self.executor.submit(process_job, job_uuid)
+                future.add_done_callback(partial(future_finished_callback, job_uuid))
 
             # Do a quick sleep regardless to see if it
             # gives processes a chance to start up
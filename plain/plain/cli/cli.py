@@ -576,7 +576,9 @@ class PlainCommandCollection(click.CommandCollection):
         self.sources = sources
 
     def get_command(self, ctx: Context, cmd_name: str) -> Command | None:
-        cmd = super().get_command(ctx, cmd_name)
+        # Core commands are a plain dict lookup, so check them before
+        # the other sources that have to search for modules on disk
+        cmd = plain_cli.get_command(ctx, cmd_name) or super().get_command(ctx, cmd_name)
         if cmd:
             # Pass the formatting down to subcommands automatically
             cmd.context_class = self.context_class
@@ -1,4 +1,5 @@
 import importlib
+from functools import cached_property
 from importlib.metadata import entry_points
 from importlib.util import find_spec
 
@@ -25,15 +26,10 @@ class InstalledPackagesGroup(click.Group):
             if not find_spec(f"{app.name}.{self.MODULE_NAME}"):
                 continue
 
-            cli_name = app.name
-
-            # Change plain.{pkg} to just {pkg}
-            if cli_name.startswith(self.PLAIN_APPS_PREFIX):
-                cli_name = cli_name[len(self.PLAIN_APPS_PREFIX) :]
-
-            # Change app.{pkg} to just {pkg}
-            if cli_name.startswith(self.APP_PREFIX):
-                cli_name = cli_name[len(self.APP_PREFIX) :]
+            # Change plain.{pkg} and app.{pkg} to just {pkg}
+            cli_name = app.name.removeprefix(self.PLAIN_APPS_PREFIX).removeprefix(
+                self.APP_PREFIX
+            )
 
             if cli_name in command_names:
                 raise ValueError(
@@ -79,16 +75,15 @@ class EntryPointGroup(click.Group):
 
     ENTRYPOINT_NAME = "plain.cli"
 
-    def list_commands(self, ctx):
-        rv = []
+    @cached_property
+    def _entry_points(self):
+        # Scanning the installed distributions is slow,
+        # and they don't change while the CLI is running
+        return entry_points().select(group=self.ENTRYPOINT_NAME)
 
-        for entry_point in entry_points().select(group=self.ENTRYPOINT_NAME):
-            rv.append(entry_point.name)
-
-        rv.sort()
-        return rv
+    def list_commands(self, ctx):
+        return sorted(self._entry_points.names)
 
     def get_command(self, ctx, name):
-        for entry_point in entry_points().select(group=self.ENTRYPOINT_NAME):
-            if entry_point.name == name:
-                return entry_point.load()
+        if name in self._entry_points.names:
+            return self._entry_points[name].load()
@@ -5,6 +5,7 @@ from urllib.parse import quote
 from plain import signals
 from plain.http import HttpRequest, QueryDict, parse_cookie
 from plain.internal.handlers import base
+from plain.urls import get_resolver
 from plain.utils.functional import cached_property
 from plain.utils.regex_helper import _lazy_re_compile
 
@@ -131,6 +132,10 @@ class WSGIHandler(base.BaseHandler):
         super().__init__(*args, **kwargs)
         self.load_middleware()
 
+        # Import the URLS_MODULE and build the root resolver at startup,
+        # instead of making the first request do it
+        get_resolver()
+
     def __call__(self, environ, start_response):
         signals.request_started.send(sender=self.__class__, environ=environ)
         request = self.request_class(environ)
@@ -2,8 +2,18 @@ import logging
 import logging.config
 from os import environ
 
+# The LOGGING settings from the last call, so repeated setup can be skipped
+_configured_logging_settings = object()
+
 
 def configure_logging(logging_settings):
+    global _configured_logging_settings
+
+    # dictConfig resets the cache on every existing logger,
+    # so don't reconfigure for settings that are already applied
+    if logging_settings is _configured_logging_settings:
+        return
+
     # Load the defaults
     default_logging = {
         "version": 1,
@@ -37,3 +47,5 @@ def configure_logging(logging_settings):
     # Then customize it from settings
     if logging_settings:
         logging.config.dictConfig(logging_settings)
+
+    _configured_logging_settings = logging_settings
@@ -2,6 +2,14 @@ import logging
 
 request_logger = logging.getLogger("plain.request")
 
+_log_levels = {
+    "critical": logging.CRITICAL,
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+}
+
 
 def log_response(
     message,
@@ -34,7 +42,15 @@ def log_response(
         else:
             level = "info"
 
-    getattr(logger, level)(
+    levelno = _log_levels[level]
+
+    # Don't build the log record if the level is filtered out anyway
+    if not logger.isEnabledFor(levelno):
+        response._has_been_logged = True
+        return
+
+    logger.log(
+        levelno,
         message,
         *args,
         extra={
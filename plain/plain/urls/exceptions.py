@@ -5,5 +5,18 @@ class Resolver404(Http404):
     pass
 
 
+class Resolver404Info:
+    """The path that couldn't be resolved, and the patterns that were tried."""
+
+    __slots__ = ("path", "tried")
+
+    def __init__(self, path, tried=None):
+        self.path = path
+        self.tried = tried
+
+    def __repr__(self):
+        return f"Resolver404Info(path={self.path!r}, tried={self.tried!r})"
+
+
 class NoReverseMatch(Exception):
     pass
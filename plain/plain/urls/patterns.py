@@ -162,8 +162,19 @@ class RoutePattern(CheckURLMixin):
         self.name = name
         self.converters = _route_to_regex(str(route), is_endpoint)[1]
         self.regex = self._compile(str(route))
+        # Routes without parameters can be matched with string comparisons
+        self._static_route = None if self.converters else str(route)
 
     def match(self, path):
+        if self._static_route is not None:
+            if self._is_endpoint:
+                matched = path == self._static_route
+            else:
+                matched = path.startswith(self._static_route)
+            if matched:
+                return path[len(self._static_route) :], (), {}
+            return None
+
         match = self.regex.search(path)
         if match:
             # RoutePattern doesn't allow non-named groups so args are ignored.
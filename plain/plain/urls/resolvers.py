@@ -16,14 +16,31 @@ from urllib.parse import quote
 from plain.preflight.urls import check_resolver
 from plain.runtime import settings
 from plain.utils.datastructures import MultiValueDict
+from plain.utils.functional import cached_property
 from plain.utils.http import RFC3986_SUBDELIMS, escape_leading_slashes
 from plain.utils.regex_helper import normalize
 
-from .exceptions import NoReverseMatch, Resolver404
-from .patterns import RegexPattern, URLPattern
+from .exceptions import NoReverseMatch, Resolver404, Resolver404Info
+from .patterns import RegexPattern, RoutePattern, URLPattern
 
 
 class ResolverMatch:
+    # One of these is created for every request, so skip the instance __dict__
+    __slots__ = (
+        "func",
+        "args",
+        "kwargs",
+        "url_name",
+        "route",
+        "tried",
+        "captured_kwargs",
+        "extra_kwargs",
+        "namespaces",
+        "namespace",
+        "_func_path",
+        "view_name",
+    )
+
     def __init__(
         self,
         func,
@@ -48,19 +65,21 @@ class ResolverMatch:
         # If a URLRegexResolver doesn't have a namespace or namespace, it passes
         # in an empty value.
         self.namespaces = [x for x in namespaces if x] if namespaces else []
-        self.namespace = ":".join(self.namespaces)
 
-        if hasattr(func, "view_class"):
-            func = func.view_class
-        if not hasattr(func, "__name__"):
-            # A class-based view
-            self._func_path = func.__class__.__module__ + "." + func.__class__.__name__
-        else:
-            # A function-based view
-            self._func_path = func.__module__ + "." + func.__name__
+        try:
+            self._func_path = _get_func_path(func)
+        except TypeError:
+            # An unhashable callable can't be cached
+            self._func_path = _get_func_path.__wrapped__(func)
 
         view_path = url_name or self._func_path
-        self.view_name = ":".join(self.namespaces + [view_path])
+        if self.namespaces:
+            self.namespace = ":".join(self.namespaces)
+            self.view_name = self.namespace + ":" + view_path
+        else:
+            # Most views aren't namespaced, so skip the joins
+            self.namespace = ""
+            self.view_name = view_path
 
     def __repr__(self):
         if isinstance(self.func, functools.partial):
@@ -87,6 +106,20 @@ class ResolverMatch:
         raise PicklingError(f"Cannot pickle {self.__class__.__qualname__}.")
 
 
+@functools.lru_cache(maxsize=2048)
+def _get_func_path(func):
+    # The same few views get resolved over and over,
+    # so their dotted paths are only built once
+    if hasattr(func, "view_class"):
+        func = func.view_class
+    if not hasattr(func, "__name__"):
+        # A class-based view
+        return func.__class__.__module__ + "." + func.__class__.__name__
+    else:
+        # A function-based view
+        return func.__module__ + "." + func.__name__
+
+
 def get_resolver(urls_module=None):
     if urls_module is None:
         urls_module = settings.URLS_MODULE
@@ -105,7 +138,10 @@ def _get_cached_resolver(urls_module):
         urls_module = import_module(urls_module)
 
     router = routers_registry.get_module_router(urls_module)
-    return URLResolver(pattern=RegexPattern(r"^/"), router=router)
+    resolver = URLResolver(pattern=RegexPattern(r"^/"), router=router)
+    # Populate up front so requests never pay for (or race on) it
+    _populate_eagerly(resolver)
+    return resolver
 
 
 @functools.cache
@@ -128,10 +164,71 @@ def get_ns_resolver(ns_pattern, resolver, converters):
         namespace = ""
         urls = [ns_resolver]
 
-    return URLResolver(
+    resolver = URLResolver(
         pattern=RegexPattern(r"^/"),
         router=_NamespacedRouter(),
     )
+    _populate_eagerly(resolver)
+    return resolver
+
+
+def _populate_eagerly(resolver):
+    try:
+        resolver._populate()
+    except ValueError:
+        # A URL pattern that can't be reversed (i.e. a regex with "(?i)")
+        # can still be resolved, so leave the resolver unpopulated and
+        # let the error come from reverse() when it populates lazily
+        pass
+
+
+@functools.cache
+def _compile_reverse_regex(pattern):
+    # Compiled on first use by reverse(), instead of on every call. Not done
+    # when populating, because a pattern that doesn't compile (i.e. an include
+    # and its child both capturing "pk") should only break reversing that name.
+    # Used with match(), which is already anchored to the start of the string.
+    return re.compile(re.escape("/") + pattern)
+
+
+def _normalize_reverse_pattern(pattern):
+    # The "/" prefix of every reversed URL is added here,
+    # instead of on every reverse() call
+    return [("/" + result, params) for result, params in normalize(pattern)]
+
+
+def _get_first_segment(url_pattern):
+    """
+    Return the static first path segment that a pattern requires,
+    or None if the pattern could match paths starting with anything.
+    """
+    pattern = url_pattern.pattern
+    if not isinstance(pattern, RoutePattern):
+        # Regex patterns are left to the regex engine
+        return None
+
+    route = str(pattern)
+    static_prefix, _, _ = route.partition("<")
+    if "/" in static_prefix:
+        return static_prefix.partition("/")[0]
+    if static_prefix == route and pattern._is_endpoint:
+        # A completely static endpoint (i.e. "health")
+        return route
+    return None
+
+
+def _is_static_endpoint(url_pattern):
+    """
+    Whether the pattern is a path() route without any parameters,
+    which can only match a path that is exactly the same as its route.
+    """
+    pattern = url_pattern.pattern
+    return (
+        isinstance(url_pattern, URLPattern)
+        and isinstance(pattern, RoutePattern)
+        and pattern._is_endpoint
+        and pattern._static_route is not None
+    )
 
 
 class URLResolver:
@@ -172,31 +269,23 @@ class URLResolver:
             return
         try:
             self._local.populating = True
-            lookups = MultiValueDict()
+            # Collect into plain lists and wrap them in a MultiValueDict at the end
+            lookups = {}
             namespaces = {}
             packages = {}
             for url_pattern in reversed(self.url_patterns):
                 p_pattern = url_pattern.pattern.regex.pattern
                 p_pattern = p_pattern.removeprefix("^")
                 if isinstance(url_pattern, URLPattern):
-                    bits = normalize(url_pattern.pattern.regex.pattern)
-                    lookups.appendlist(
-                        url_pattern.view,
-                        (
-                            bits,
-                            p_pattern,
-                            url_pattern.pattern.converters,
-                        ),
+                    bits = _normalize_reverse_pattern(url_pattern.pattern.regex.pattern)
+                    lookup = (
+                        bits,
+                        p_pattern,
+                        url_pattern.pattern.converters,
                     )
+                    lookups.setdefault(url_pattern.view, []).append(lookup)
                     if url_pattern.name is not None:
-                        lookups.appendlist(
-                            url_pattern.name,
-                            (
-                                bits,
-                                p_pattern,
-                                url_pattern.pattern.converters,
-                            ),
-                        )
+                        lookups.setdefault(url_pattern.name, []).append(lookup)
                 else:  # url_pattern is a URLResolver.
                     url_pattern._populate()
                     if url_pattern.namespace:
@@ -205,30 +294,32 @@ class URLResolver:
                         )
                         namespaces[url_pattern.namespace] = (p_pattern, url_pattern)
                     else:
-                        for name in url_pattern.reverse_dict:
-                            for (
-                                _,
-                                pat,
-                                converters,
-                            ) in url_pattern.reverse_dict.getlist(name):
-                                new_matches = normalize(p_pattern + pat)
-                                lookups.appendlist(
-                                    name,
+                        current_converters = url_pattern.pattern.converters
+                        # Merged once per include, and reused as-is for the
+                        # (common) patterns that don't have converters of their own
+                        parent_converters = {
+                            **self.pattern.converters,
+                            **current_converters,
+                        }
+                        for name, sub_lookups in url_pattern.reverse_dict.lists():
+                            name_lookups = lookups.setdefault(name, [])
+                            for _, pat, converters in sub_lookups:
+                                new_matches = _normalize_reverse_pattern(
+                                    p_pattern + pat
+                                )
+                                name_lookups.append(
                                     (
                                         new_matches,
                                         p_pattern + pat,
-                                        {
-                                            **self.pattern.converters,
-                                            **url_pattern.pattern.converters,
-                                            **converters,
-                                        },
-                                    ),
+                                        {**parent_converters, **converters}
+                                        if converters
+                                        else parent_converters,
+                                    )
                                 )
                         for namespace, (
                             prefix,
                             sub_pattern,
                         ) in url_pattern.namespace_dict.items():
-                            current_converters = url_pattern.pattern.converters
                             sub_pattern.pattern.converters.update(current_converters)
                             namespaces[namespace] = (p_pattern + prefix, sub_pattern)
                         for (
@@ -238,29 +329,70 @@ class URLResolver:
                             packages.setdefault(namespace, []).extend(namespace_list)
             self._namespace_dict = namespaces
             self._app_dict = packages
-            self._reverse_dict = lookups
+            self._reverse_dict = MultiValueDict(lookups)
             self._populated = True
         finally:
             self._local.populating = False
 
     @property
     def reverse_dict(self):
-        if not self._reverse_dict:
+        if not self._populated:
             self._populate()
         return self._reverse_dict
 
     @property
     def namespace_dict(self):
-        if not self._namespace_dict:
+        if not self._populated:
             self._populate()
         return self._namespace_dict
 
     @property
     def app_dict(self):
-        if not self._app_dict:
+        if not self._populated:
             self._populate()
         return self._app_dict
 
+    @cached_property
+    def _url_patterns_by_segment(self):
+        """
+        Group url_patterns by the first path segment they require, so resolve()
+        only tries the patterns that could match instead of scanning all of them.
+        Patterns without a static first segment stay in every group, and each
+        group keeps the original order so the first match still wins.
+        """
+        segments = [_get_first_segment(pattern) for pattern in self.url_patterns]
+        patterns_by_segment = {
+            segment: tuple(
+                pattern
+                for pattern, pattern_segment in zip(self.url_patterns, segments)
+                if pattern_segment is None or pattern_segment == segment
+            )
+            for segment in segments
+            if segment is not None
+        }
+        unsegmented_patterns = tuple(
+            pattern
+            for pattern, pattern_segment in zip(self.url_patterns, segments)
+            if pattern_segment is None
+        )
+        return patterns_by_segment, unsegmented_patterns
+
+    @cached_property
+    def _static_url_patterns(self):
+        """
+        Map the paths of static endpoints (i.e. "login/") to their pattern,
+        as long as no other kind of pattern comes before them in their group.
+        """
+        patterns_by_segment, _ = self._url_patterns_by_segment
+        static_url_patterns = {}
+        for url_patterns in patterns_by_segment.values():
+            for url_pattern in url_patterns:
+                if not _is_static_endpoint(url_pattern):
+                    # Anything after this has to wait for it to be tried first
+                    break
+                static_url_patterns.setdefault(str(url_pattern.pattern), url_pattern)
+        return static_url_patterns
+
     @staticmethod
     def _extend_tried(tried, pattern, sub_tried=None):
         if sub_tried is None:
@@ -282,11 +414,19 @@ class URLResolver:
         match = self.pattern.match(path)
         if match:
             new_path, args, kwargs = match
-            for pattern in self.url_patterns:
+            if static_url_pattern := self._static_url_patterns.get(new_path):
+                url_patterns = (static_url_pattern,)
+            else:
+                patterns_by_segment, unsegmented_patterns = (
+                    self._url_patterns_by_segment
+                )
+                segment = new_path.partition("/")[0]
+                url_patterns = patterns_by_segment.get(segment, unsegmented_patterns)
+            for pattern in url_patterns:
                 try:
                     sub_match = pattern.resolve(new_path)
                 except Resolver404 as e:
-                    self._extend_tried(tried, pattern, e.args[0].get("tried"))
+                    self._extend_tried(tried, pattern, e.args[0].tried)
                 else:
                     if sub_match:
                         # Merge captured arguments in match with submatch
@@ -303,7 +443,8 @@ class URLResolver:
                             if isinstance(pattern, URLPattern)
                             else str(pattern.pattern)
                         )
-                        self._extend_tried(tried, pattern, sub_match.tried)
+                        # The tried patterns are only needed to explain a 404,
+                        # so they aren't collected for a successful match
                         return ResolverMatch(
                             sub_match.func,
                             sub_match_args,
@@ -311,25 +452,22 @@ class URLResolver:
                             sub_match.url_name,
                             [self.namespace] + sub_match.namespaces,
                             self._join_route(current_route, sub_match.route),
-                            tried,
+                            None,
                             captured_kwargs=sub_match.captured_kwargs,
                             extra_kwargs=sub_match.extra_kwargs,
                         )
                     tried.append([pattern])
-            raise Resolver404({"tried": tried, "path": new_path})
-        raise Resolver404({"path": path})
+            raise Resolver404(Resolver404Info(new_path, tried))
+        raise Resolver404(Resolver404Info(path))
 
     def reverse(self, lookup_view, *args, **kwargs):
         if args and kwargs:
             raise ValueError("Don't mix *args and **kwargs in call to reverse()!")
 
-        if not self._populated:
-            self._populate()
-
         possibilities = self.reverse_dict.getlist(lookup_view)
 
         for possibility, pattern, converters in possibilities:
-            for result, params in possibility:
+            for candidate_pat, params in possibility:
                 if args:
                     if len(args) != len(params):
                         continue
@@ -339,17 +477,21 @@ class URLResolver:
                         continue
                     candidate_subs = kwargs
                 # Convert the candidate subs to text using Converter.to_url().
-                text_candidate_subs = {}
                 match = True
-                for k, v in candidate_subs.items():
-                    if k in converters:
-                        try:
-                            text_candidate_subs[k] = converters[k].to_url(v)
-                        except ValueError:
-                            match = False
-                            break
-                    else:
-                        text_candidate_subs[k] = str(v)
+                if not converters:
+                    # Regex routes don't have converters, so everything is just str()
+                    text_candidate_subs = {k: str(v) for k, v in candidate_subs.items()}
+                else:
+                    text_candidate_subs = {}
+                    for k, v in candidate_subs.items():
+                        if (converter := converters.get(k)) is not None:
+                            try:
+                                text_candidate_subs[k] = converter.to_url(v)
+                            except ValueError:
+                                match = False
+                                break
+                        else:
+                            text_candidate_subs[k] = str(v)
                 if not match:
                     continue
                 # WSGI provides decoded URLs, without %xx escapes, and the URL
@@ -357,21 +499,10 @@ class URLResolver:
                 # without quoting to build a decoded URL and look for a match.
                 # Then, if we have a match, redo the substitution with quoted
                 # arguments in order to return a properly encoded URL.
-
-                # There was a lot of script_prefix handling code before,
-                # so this is a crutch to leave the below as-is for now.
-                _prefix = "/"
-
-                candidate_pat = _prefix.replace("%", "%%") + result
-                if re.search(
-                    f"^{re.escape(_prefix)}{pattern}",
-                    candidate_pat % text_candidate_subs,
-                ):
+                candidate_url = candidate_pat % text_candidate_subs
+                if _compile_reverse_regex(pattern).match(candidate_url):
                     # safe characters from `pchar` definition of RFC 3986
-                    url = quote(
-                        candidate_pat % text_candidate_subs,
-                        safe=RFC3986_SUBDELIMS + "/~:@",
-                    )
+                    url = quote(candidate_url, safe=RFC3986_SUBDELIMS + "/~:@")
                     # Don't allow construction of scheme relative urls.
                     return escape_leading_slashes(url)
         # lookup_view can be URL name or callable, but callables are not
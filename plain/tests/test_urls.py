@@ -0,0 +1,176 @@
+import re
+import types
+
+import pytest
+
+from plain.urls import (
+    NoReverseMatch,
+    Resolver404,
+    RouterBase,
+    URLResolver,
+    get_resolver,
+    include,
+    path,
+    register_router,
+)
+from plain.urls.patterns import RegexPattern
+
+
+def view(request):
+    pass
+
+
+def other_view(request):
+    pass
+
+
+def get_test_resolver(urls):
+    class Router(RouterBase):
+        namespace = ""
+
+    Router.urls = urls
+
+    return URLResolver(pattern=RegexPattern(r"^/"), router=Router())
+
+
+def test_resolve_static_and_dynamic_routes():
+    resolver = get_test_resolver(
+        [
+            path("", view, name="index"),
+            path("health", view, name="health"),
+            path("items/<int:pk>/", view, name="item"),
+            path("files/<path:file_path>", view, name="file"),
+            path(re.compile(r"^archive/(?P<year>[0-9]{4})/$"), view, name="year"),
+        ]
+    )
+
+    assert resolver.resolve("/").url_name == "index"
+    assert resolver.resolve("/health").url_name == "health"
+    assert resolver.resolve("/items/3/").kwargs == {"pk": 3}
+    assert resolver.resolve("/files/a/b.txt").kwargs == {"file_path": "a/b.txt"}
+    assert resolver.resolve("/archive/2024/").kwargs == {"year": "2024"}
+
+    with pytest.raises(Resolver404) as exc_info:
+        resolver.resolve("/health/")
+    assert exc_info.value.args[0].path == "health/"
+    assert exc_info.value.args[0].tried
+
+    with pytest.raises(Resolver404):
+        resolver.resolve("/items/x/")
+
+
+def test_resolve_keeps_pattern_order():
+    resolver = get_test_resolver(
+        [
+            path("<str:slug>/", other_view, name="slug"),
+            path("login/", view, name="login"),
+            path("items/<int:pk>/", view, name="item"),
+            path("items/<str:pk>/", other_view, name="item_str"),
+        ]
+    )
+
+    # The dynamic pattern comes first, so it wins over the static one
+    assert resolver.resolve("/login/").url_name == "slug"
+    assert resolver.resolve("/items/1/").url_name == "item"
+    assert resolver.resolve("/items/a/").url_name == "item_str"
+
+
+def test_resolve_include():
+    resolver = get_test_resolver(
+        [
+            include("api/<int:version>/", [path("things/", view, name="things")]),
+            include("admin/", [path("", other_view, name="admin")]),
+        ]
+    )
+
+    match = resolver.resolve("/api/2/things/")
+    assert match.url_name == "things"
+    assert match.kwargs == {"version": 2}
+    assert match.route == "api/<int:version>/things/"
+
+    assert resolver.resolve("/admin/").url_name == "admin"
+
+    with pytest.raises(Resolver404):
+        resolver.resolve("/api/2/other/")
+
+
+def test_reverse():
+    resolver = get_test_resolver(
+        [
+            path("", view, name="index"),
+            path("items/<int:pk>/", view, name="item"),
+            path("files/<path:file_path>", view, name="file"),
+            include("api/<int:version>/", [path("things/", view, name="things")]),
+        ]
+    )
+
+    assert resolver.reverse("index") == "/"
+    assert resolver.reverse("item", pk=3) == "/items/3/"
+    assert resolver.reverse("item", 3) == "/items/3/"
+    assert resolver.reverse("file", file_path="a b/c") == "/files/a%20b/c"
+    assert resolver.reverse("things", version=2) == "/api/2/things/"
+
+    with pytest.raises(NoReverseMatch):
+        resolver.reverse("item", pk="x")
+
+    with pytest.raises(NoReverseMatch):
+        resolver.reverse("missing")
+
+
+def test_reverse_with_repeated_parameter_name():
+    resolver = get_test_resolver(
+        [
+            path("", view, name="index"),
+            include("items/<int:pk>/", [path("sub/<int:pk>/", view, name="sub")]),
+        ]
+    )
+
+    assert resolver.resolve("/items/1/sub/2/").kwargs == {"pk": 2}
+    assert resolver.reverse("index") == "/"
+
+    # Only the name with the repeated group fails to reverse
+    with pytest.raises(re.error):
+        resolver.reverse("sub", pk=2)
+
+
+@register_router
+class Router(RouterBase):
+    namespace = ""
+    urls = [path("other/", other_view, name="other")]
+
+
+def test_get_resolver_follows_urls_module_setting():
+    from plain.runtime import settings
+
+    original_urls_module = settings.URLS_MODULE
+    assert not isinstance(get_resolver().router, Router)
+
+    settings.URLS_MODULE = __name__
+    try:
+        assert isinstance(get_resolver().router, Router)
+        assert get_resolver().reverse("other") == "/other/"
+    finally:
+        settings.URLS_MODULE = original_urls_module
+
+    assert not isinstance(get_resolver().router, Router)
+
+
+def test_get_resolver_with_irreversible_pattern():
+    urls_module = types.ModuleType("test_urls_irreversible")
+
+    class IrreversibleRouter(RouterBase):
+        __module__ = urls_module.__name__
+        namespace = ""
+        urls = [
+            path("", view, name="index"),
+            path(re.compile(r"(?i)^shout/$"), other_view, name="shout"),
+        ]
+
+    register_router(IrreversibleRouter)
+
+    # The resolver is still built and can resolve, only reverse() fails
+    resolver = get_resolver(urls_module)
+    assert resolver.resolve("/SHOUT/").url_name == "shout"
+
+    with pytest.raises(ValueError):
+        resolver.reverse("index")